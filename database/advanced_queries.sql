@@ -349,7 +349,7 @@ WITH paper_impact_metrics AS (
         p.id,
         p.title,
         p.publication_date,
-        p.journal,
+        j.name as journal,
         p.citation_count,
         
         -- TODO: Time-adjusted citation metrics
@@ -369,7 +369,8 @@ WITH paper_impact_metrics AS (
         ??? as methodological_novelty -- Novel methods indicator
         
     FROM papers p
-    -- TODO: Add necessary joins for author, journal, and citation data
+    LEFT JOIN journals j ON j.id = p.journal_id
+    -- TODO: Add necessary joins for author and citation data
     WHERE p.publication_date >= date('now', '-10 years')  -- Focus on recent work
 ),
 impact_percentiles AS (
@@ -8,7 +8,7 @@
 
 -- AUTHORS: Central entity for tracking researcher networks
 -- Interview Concept: Demonstrates understanding of identity resolution
-CREATE TABLE authors (
+CREATE TABLE IF NOT EXISTS authors (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
     email TEXT UNIQUE,
@@ -19,16 +19,29 @@ CREATE TABLE authors (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- JOURNALS / KEYWORDS: Vocabulary lookup tables
+-- Interview Concept: Normalization - papers store a small integer key instead
+-- of repeating the string, so indexes and joins stay narrow
+CREATE TABLE IF NOT EXISTS journals (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS keywords (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE
+);
+
 -- PAPERS: Core scientific literature entity
 -- Interview Concept: Shows temporal modeling and metadata management
-CREATE TABLE papers (
+CREATE TABLE IF NOT EXISTS papers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     title TEXT NOT NULL,
     abstract TEXT,
     doi TEXT UNIQUE, -- Digital Object Identifier - industry standard
     arxiv_id TEXT UNIQUE, -- For preprints
     publication_date DATE,
-    journal TEXT,
+    journal_id INTEGER REFERENCES journals(id),
     volume TEXT,
     issue TEXT,
     pages TEXT,
@@ -40,7 +53,7 @@ CREATE TABLE papers (
     
     -- Research domain classification
     primary_domain TEXT DEFAULT 'battery_research',
-    secondary_domains TEXT, -- JSON array of additional domains
+    secondary_domains JSON, -- JSON array of additional domains
     
     -- Metrics for impact analysis
     citation_count INTEGER DEFAULT 0,
@@ -53,7 +66,7 @@ CREATE TABLE papers (
 
 -- DATASETS: Linking papers to their underlying data
 -- Interview Concept: Shows data provenance tracking (critical at AI companies)
-CREATE TABLE datasets (
+CREATE TABLE IF NOT EXISTS datasets (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
     description TEXT,
@@ -70,9 +83,13 @@ CREATE TABLE datasets (
 -- RELATIONSHIP TABLES: The real complexity lies here
 -- =============================================================================
 
+-- The pure join tables below are WITHOUT ROWID: rows are stored directly in
+-- the composite primary-key B-tree, so lookups skip the hidden rowid hop and
+-- the table carries no separate PK index.
+
 -- PAPER_AUTHORS: Many-to-many with author ordering
 -- Interview Concept: Demonstrates handling of ordered relationships
-CREATE TABLE paper_authors (
+CREATE TABLE IF NOT EXISTS paper_authors (
     paper_id INTEGER,
     author_id INTEGER,
     author_position INTEGER NOT NULL, -- 1st author, 2nd author, etc.
@@ -80,36 +97,54 @@ CREATE TABLE paper_authors (
     PRIMARY KEY (paper_id, author_id),
     FOREIGN KEY (paper_id) REFERENCES papers(id) ON DELETE CASCADE,
     FOREIGN KEY (author_id) REFERENCES authors(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+-- CITATION_TYPES: Lookup for citation category codes
+-- Citations store the small integer id (one byte on disk) instead of the name
+CREATE TABLE IF NOT EXISTS citation_types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
 );
 
+INSERT OR IGNORE INTO citation_types (id, name) VALUES
+    (0, 'direct'), (1, 'comparative'), (2, 'methodological'), (3, 'background');
+
 -- CITATIONS: The citation graph - this is where graph analytics happen
 -- Interview Concept: Shows understanding of network/graph data in relational DBs
-CREATE TABLE citations (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+CREATE TABLE IF NOT EXISTS citations (
     citing_paper_id INTEGER NOT NULL,
     cited_paper_id INTEGER NOT NULL,
     citation_context TEXT, -- The sentence/paragraph where citation appears
-    citation_type TEXT CHECK (citation_type IN ('direct', 'comparative', 'methodological', 'background')),
+    citation_type_id INTEGER NOT NULL REFERENCES citation_types(id), -- 1-byte code, see citation_types
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
     -- Prevent self-citation and duplicate citations
-    UNIQUE(citing_paper_id, cited_paper_id),
+    PRIMARY KEY (citing_paper_id, cited_paper_id),
     CHECK(citing_paper_id != cited_paper_id),
     
     FOREIGN KEY (citing_paper_id) REFERENCES papers(id) ON DELETE CASCADE,
     FOREIGN KEY (cited_paper_id) REFERENCES papers(id) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
+
+-- PAPER_KEYWORDS: Which keywords describe which papers
+CREATE TABLE IF NOT EXISTS paper_keywords (
+    paper_id INTEGER,
+    keyword_id INTEGER,
+    PRIMARY KEY (paper_id, keyword_id),
+    FOREIGN KEY (paper_id) REFERENCES papers(id) ON DELETE CASCADE,
+    FOREIGN KEY (keyword_id) REFERENCES keywords(id) ON DELETE CASCADE
+) WITHOUT ROWID;
 
 -- PAPER_DATASETS: Which papers use which datasets
 -- Interview Concept: Data lineage tracking (essential for ML companies)
-CREATE TABLE paper_datasets (
+CREATE TABLE IF NOT EXISTS paper_datasets (
     paper_id INTEGER,
     dataset_id INTEGER,
     usage_type TEXT, -- 'primary', 'validation', 'comparison', 'replication'
     PRIMARY KEY (paper_id, dataset_id),
     FOREIGN KEY (paper_id) REFERENCES papers(id) ON DELETE CASCADE,
     FOREIGN KEY (dataset_id) REFERENCES datasets(id) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- =============================================================================
 -- ADVANCED FEATURES: What sets this apart from basic CRUD
@@ -117,7 +152,7 @@ CREATE TABLE paper_datasets (
 
 -- RESEARCH_TRENDS: Time-series analysis of research topics
 -- Interview Concept: Temporal analytics and trend detection
-CREATE TABLE research_trends (
+CREATE TABLE IF NOT EXISTS research_trends (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     keyword TEXT NOT NULL,
     year INTEGER NOT NULL,
@@ -129,14 +164,14 @@ CREATE TABLE research_trends (
 
 -- COLLABORATION_NETWORKS: Precomputed author collaboration metrics
 -- Interview Concept: Graph metrics and network analysis
-CREATE TABLE collaboration_networks (
+CREATE TABLE IF NOT EXISTS collaboration_networks (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     author1_id INTEGER,
     author2_id INTEGER,
     collaboration_count INTEGER DEFAULT 1,
     first_collaboration_date DATE,
     last_collaboration_date DATE,
-    shared_papers TEXT, -- JSON array of paper IDs
+    shared_papers JSON, -- JSON array of paper IDs
     
     -- Ensure consistent ordering for undirected relationships
     CHECK(author1_id < author2_id),
@@ -146,30 +181,37 @@ CREATE TABLE collaboration_networks (
     FOREIGN KEY (author2_id) REFERENCES authors(id) ON DELETE CASCADE
 );
 
+-- _META: Internal key/value bookkeeping (schema fingerprints for drift detection)
+CREATE TABLE IF NOT EXISTS _meta (
+    k TEXT PRIMARY KEY,
+    v TEXT
+) WITHOUT ROWID;
+
 -- =============================================================================
 -- INDEXES: Performance optimization (crucial for interview discussions)
 -- =============================================================================
 
 -- Primary lookup indexes
-CREATE INDEX idx_papers_doi ON papers(doi);
-CREATE INDEX idx_papers_publication_date ON papers(publication_date);
-CREATE INDEX idx_papers_journal ON papers(journal);
-CREATE INDEX idx_authors_name ON authors(name);
-CREATE INDEX idx_authors_affiliation ON authors(affiliation);
+CREATE INDEX IF NOT EXISTS idx_papers_doi ON papers(doi);
+CREATE INDEX IF NOT EXISTS idx_papers_publication_date ON papers(publication_date);
+CREATE INDEX IF NOT EXISTS idx_papers_journal ON papers(journal_id);
+CREATE INDEX IF NOT EXISTS idx_authors_name ON authors(name);
+CREATE INDEX IF NOT EXISTS idx_authors_affiliation ON authors(affiliation);
 
 -- Relationship traversal indexes
-CREATE INDEX idx_paper_authors_paper ON paper_authors(paper_id);
-CREATE INDEX idx_paper_authors_author ON paper_authors(author_id);
-CREATE INDEX idx_citations_citing ON citations(citing_paper_id);
-CREATE INDEX idx_citations_cited ON citations(cited_paper_id);
+CREATE INDEX IF NOT EXISTS idx_paper_authors_paper ON paper_authors(paper_id);
+CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors(author_id);
+CREATE INDEX IF NOT EXISTS idx_citations_citing ON citations(citing_paper_id);
+CREATE INDEX IF NOT EXISTS idx_citations_cited ON citations(cited_paper_id);
+CREATE INDEX IF NOT EXISTS idx_paper_keywords_keyword ON paper_keywords(keyword_id);
 
 -- Analytics indexes
-CREATE INDEX idx_papers_citation_count ON papers(citation_count DESC);
-CREATE INDEX idx_research_trends_year_keyword ON research_trends(year, keyword);
+CREATE INDEX IF NOT EXISTS idx_papers_citation_count ON papers(citation_count DESC);
+CREATE INDEX IF NOT EXISTS idx_research_trends_year_keyword ON research_trends(year, keyword);
 
 -- Composite indexes for common query patterns
-CREATE INDEX idx_papers_domain_date ON papers(primary_domain, publication_date);
-CREATE INDEX idx_citations_type_date ON citations(citation_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_papers_domain_date ON papers(primary_domain, publication_date);
+CREATE INDEX IF NOT EXISTS idx_citations_type_date ON citations(citation_type_id, created_at);
 
 -- =============================================================================
 -- FULL-TEXT SEARCH: Essential for literature systems
@@ -177,26 +219,35 @@ CREATE INDEX idx_citations_type_date ON citations(citation_type, created_at);
 
 -- FTS5 virtual table for paper content search
 -- Interview Concept: Shows understanding of search optimization
-CREATE VIRTUAL TABLE papers_fts USING fts5(
+-- External-content table: the text lives only in papers, the FTS index stores
+-- just the inverted index. Query it with "papers_fts MATCH ?" (the table name,
+-- not a column) so the planner uses the full-text index.
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
     title,
     abstract,
     full_text,
     content='papers',
-    content_rowid='id'
+    content_rowid='id',
+    tokenize='porter unicode61'
 );
 
 -- Triggers to keep FTS table in sync
-CREATE TRIGGER papers_fts_insert AFTER INSERT ON papers BEGIN
+-- External-content tables must be told the old values to remove them from
+-- the index, via the special 'delete' command.
+CREATE TRIGGER IF NOT EXISTS papers_fts_insert AFTER INSERT ON papers BEGIN
     INSERT INTO papers_fts(rowid, title, abstract, full_text)
     VALUES (new.id, new.title, new.abstract, new.full_text);
 END;
 
-CREATE TRIGGER papers_fts_delete AFTER DELETE ON papers BEGIN
-    DELETE FROM papers_fts WHERE rowid = old.id;
+CREATE TRIGGER IF NOT EXISTS papers_fts_delete AFTER DELETE ON papers BEGIN
+    INSERT INTO papers_fts(papers_fts, rowid, title, abstract, full_text)
+    VALUES ('delete', old.id, old.title, old.abstract, old.full_text);
 END;
 
-CREATE TRIGGER papers_fts_update AFTER UPDATE ON papers BEGIN
-    DELETE FROM papers_fts WHERE rowid = old.id;
+-- Only reindex when searchable text changes, not on citation_count updates
+CREATE TRIGGER IF NOT EXISTS papers_fts_update AFTER UPDATE OF title, abstract, full_text ON papers BEGIN
+    INSERT INTO papers_fts(papers_fts, rowid, title, abstract, full_text)
+    VALUES ('delete', old.id, old.title, old.abstract, old.full_text);
     INSERT INTO papers_fts(rowid, title, abstract, full_text)
     VALUES (new.id, new.title, new.abstract, new.full_text);
 END;
@@ -206,7 +257,7 @@ END;
 -- =============================================================================
 
 -- Materialized view concept: Author impact metrics
-CREATE VIEW author_impact_metrics AS
+CREATE VIEW IF NOT EXISTS author_impact_metrics AS
 SELECT 
     a.id,
     a.name,
@@ -222,7 +273,7 @@ LEFT JOIN papers p ON pa.paper_id = p.id
 GROUP BY a.id, a.name, a.affiliation;
 
 -- Citation network view for graph analysis
-CREATE VIEW citation_network AS
+CREATE VIEW IF NOT EXISTS citation_network AS
 SELECT 
     c.citing_paper_id,
     c.cited_paper_id,
@@ -230,8 +281,9 @@ SELECT
     p2.title as cited_title,
     p1.publication_date as citing_date,
     p2.publication_date as cited_date,
-    c.citation_type,
+    ct.name as citation_type,
     julianday(p1.publication_date) - julianday(p2.publication_date) as citation_lag_days
 FROM citations c
 JOIN papers p1 ON c.citing_paper_id = p1.id
-JOIN papers p2 ON c.cited_paper_id = p2.id;
\ No newline at end of file
+JOIN papers p2 ON c.cited_paper_id = p2.id
+JOIN citation_types ct ON c.citation_type_id = ct.id;
\ No newline at end of file
@@ -6,73 +6,58 @@ tested in technical interviews for senior engineering roles.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Annotated, ClassVar, List, Optional, Set, Tuple, Union
 
-from pydantic import Field, field_validator, ConfigDict
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
-class DatabaseSettings(BaseSettings):
+class DatabaseSettings(BaseModel):
     """Database configuration settings."""
     
-    model_config = SettingsConfigDict(env_prefix="DATABASE_")
-    
     url: str = Field(default="sqlite:///./data/scientific_literature.db")
     path: str = Field(default="./data/scientific_literature.db") 
     pool_size: int = Field(default=5, ge=1, le=20)
     max_overflow: int = Field(default=10, ge=0, le=30)
     echo: bool = Field(default=False)
-    
-    @field_validator("path")
-    @classmethod
-    def ensure_data_directory(cls, v: str) -> str:
-        """Ensure the data directory exists."""
-        path = Path(v)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        return str(path)
 
 
-class APIKeySettings(BaseSettings):
+class APIKeySettings(BaseModel):
     """API keys for external services."""
     
-    model_config = SettingsConfigDict(env_prefix="")
-    
     # OpenAI configuration
-    openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
-    openai_organization_id: Optional[str] = Field(default=None, alias="OPENAI_ORGANIZATION_ID")
-    openai_default_model: str = Field(default="gpt-4-turbo-preview", alias="OPENAI_DEFAULT_MODEL")
+    openai_api_key: Optional[str] = Field(default=None)
+    openai_organization_id: Optional[str] = Field(default=None)
+    openai_default_model: str = Field(default="gpt-4-turbo-preview")
     
     # Anthropic configuration
-    anthropic_api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
-    anthropic_default_model: str = Field(default="claude-3-sonnet-20240229", alias="ANTHROPIC_DEFAULT_MODEL")
+    anthropic_api_key: Optional[str] = Field(default=None)
+    anthropic_default_model: str = Field(default="claude-3-sonnet-20240229")
     
     # ElevenLabs configuration
-    elevenlabs_api_key: Optional[str] = Field(default=None, alias="ELEVENLABS_API_KEY")
-    elevenlabs_voice_id: Optional[str] = Field(default=None, alias="ELEVENLABS_VOICE_ID")
+    elevenlabs_api_key: Optional[str] = Field(default=None)
+    elevenlabs_voice_id: Optional[str] = Field(default=None)
 
 
-class ExternalAPISettings(BaseSettings):
+class ExternalAPISettings(BaseModel):
     """External API endpoints and rate limiting."""
     
-    model_config = SettingsConfigDict(env_prefix="")
-    
     # Academic data sources
-    arxiv_api_base: str = Field(default="http://export.arxiv.org/api/query", alias="ARXIV_API_BASE")
-    crossref_api_base: str = Field(default="https://api.crossref.org", alias="CROSSREF_API_BASE")
-    semantic_scholar_api_base: str = Field(default="https://api.semanticscholar.org/graph/v1", alias="SEMANTIC_SCHOLAR_API_BASE")
+    arxiv_api_base: str = Field(default="http://export.arxiv.org/api/query")
+    crossref_api_base: str = Field(default="https://api.crossref.org")
+    semantic_scholar_api_base: str = Field(default="https://api.semanticscholar.org/graph/v1")
     
     # Rate limiting (requests per minute)
-    arxiv_rate_limit: int = Field(default=180, alias="ARXIV_RATE_LIMIT")
-    crossref_rate_limit: int = Field(default=50, alias="CROSSREF_RATE_LIMIT")
-    semantic_scholar_rate_limit: int = Field(default=100, alias="SEMANTIC_SCHOLAR_RATE_LIMIT")
+    arxiv_rate_limit: int = Field(default=180)
+    crossref_rate_limit: int = Field(default=50)
+    semantic_scholar_rate_limit: int = Field(default=100)
 
 
-class SparkSettings(BaseSettings):
+class SparkSettings(BaseModel):
     """Apache Spark configuration for big data processing."""
     
-    model_config = SettingsConfigDict(env_prefix="SPARK_")
-    
     master: str = Field(default="local[*]")
     app_name: str = Field(default="scientific-literature-intelligence")
     executor_memory: str = Field(default="2g")
@@ -80,69 +65,54 @@ class SparkSettings(BaseSettings):
     max_result_size: str = Field(default="1g")
 
 
-class CacheSettings(BaseSettings):
+class CacheSettings(BaseModel):
     """Caching configuration."""
     
-    model_config = SettingsConfigDict(env_prefix="CACHE_")
-    
     dir: str = Field(default="./cache")
     ttl: int = Field(default=3600, ge=60)  # TTL in seconds, minimum 1 minute
     max_size: int = Field(default=1000, ge=10)
     
     # Redis configuration (optional)
-    redis_url: Optional[str] = Field(default=None, alias="REDIS_URL")
-    
-    @field_validator("dir")
-    @classmethod
-    def ensure_cache_directory(cls, v: str) -> str:
-        """Ensure the cache directory exists."""
-        path = Path(v)
-        path.mkdir(parents=True, exist_ok=True)
-        return str(path)
+    redis_url: Optional[str] = Field(default=None)
 
 
-class APIServerSettings(BaseSettings):
+class APIServerSettings(BaseModel):
     """API server configuration."""
     
-    model_config = SettingsConfigDict(env_prefix="API_")
-    
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000, ge=1, le=65535)
     reload: bool = Field(default=False)
     workers: int = Field(default=1, ge=1)
     
     # Rate limiting
-    rate_limit: str = Field(default="1000/hour", alias="API_RATE_LIMIT")
-    burst_limit: str = Field(default="100/minute", alias="API_BURST_LIMIT")
+    rate_limit: str = Field(default="1000/hour")
+    burst_limit: str = Field(default="100/minute")
 
 
-class SecuritySettings(BaseSettings):
+class SecuritySettings(BaseModel):
     """Security and authentication settings."""
     
-    model_config = SettingsConfigDict(env_prefix="")
-    
-    secret_key: str = Field(default="dev-secret-key-change-in-production", alias="SECRET_KEY")
-    allowed_hosts: List[str] = Field(default=["localhost", "127.0.0.1"], alias="ALLOWED_HOSTS")
+    secret_key: str = Field(default="dev-secret-key-change-in-production")
+    # NoDecode: the env value is a comma-separated string, not JSON
+    allowed_hosts: Annotated[Tuple[str, ...], NoDecode] = Field(default=("localhost", "127.0.0.1"))
     
     # JWT settings
-    jwt_secret_key: Optional[str] = Field(default=None, alias="JWT_SECRET_KEY")
-    jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
-    jwt_expiration_hours: int = Field(default=24, ge=1, alias="JWT_EXPIRATION_HOURS")
+    jwt_secret_key: Optional[str] = Field(default=None)
+    jwt_algorithm: str = Field(default="HS256")
+    jwt_expiration_hours: int = Field(default=24, ge=1)
     
     @field_validator("allowed_hosts", mode="before")
     @classmethod
-    def parse_allowed_hosts(cls, v: Union[str, List[str]]) -> List[str]:
-        """Parse comma-separated allowed hosts."""
+    def parse_allowed_hosts(cls, v: Union[str, List[str], Tuple[str, ...]]) -> Tuple[str, ...]:
+        """Parse comma-separated allowed hosts into an immutable tuple."""
         if isinstance(v, str):
-            return [host.strip() for host in v.split(",")]
-        return v
+            return tuple(host.strip() for host in v.split(","))
+        return tuple(v)
 
 
-class FeatureFlags(BaseSettings):
+class FeatureFlags(BaseModel):
     """Feature flags for gradual rollout and experimentation."""
     
-    model_config = SettingsConfigDict(env_prefix="ENABLE_")
-    
     # Core features
     ml_recommendations: bool = Field(default=False)
     citation_analysis: bool = Field(default=True)
@@ -158,27 +128,36 @@ class FeatureFlags(BaseSettings):
     metrics: bool = Field(default=True)
 
 
-class BatchProcessingSettings(BaseSettings):
+class BatchProcessingSettings(BaseModel):
     """Settings for batch processing and background jobs."""
     
-    model_config = SettingsConfigDict(env_prefix="")
-    
     # Batch sizes
-    papers_batch_size: int = Field(default=1000, ge=100, alias="PAPERS_BATCH_SIZE")
-    authors_batch_size: int = Field(default=500, ge=50, alias="AUTHORS_BATCH_SIZE")
-    citations_batch_size: int = Field(default=2000, ge=200, alias="CITATIONS_BATCH_SIZE")
+    papers_batch_size: int = Field(default=1000, ge=100)
+    authors_batch_size: int = Field(default=500, ge=50)
+    citations_batch_size: int = Field(default=2000, ge=200)
     
     # Job processing
-    job_queue_url: str = Field(default="sqlite:///./data/jobs.db", alias="JOB_QUEUE_URL")
-    max_concurrent_jobs: int = Field(default=4, ge=1, le=16, alias="MAX_CONCURRENT_JOBS")
+    job_queue_url: str = Field(default="sqlite:///./data/jobs.db")
+    max_concurrent_jobs: int = Field(default=4, ge=1, le=16)
+    
+    # Load the largest generated tables through the sqlite3 shell's CSV
+    # importer instead of executemany (requires the sqlite3 CLI on PATH)
+    use_cli_import: bool = Field(default=False)
 
 
 class Settings(BaseSettings):
-    """Main settings class that combines all configuration sections."""
+    """
+    Main settings class that combines all configuration sections.
+    
+    This is the only BaseSettings class: .env and the environment are read
+    once here, and nested sections are filled from double-underscore
+    variables (e.g. DATABASE__POOL_SIZE -> settings.database.pool_size).
+    """
     
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
+        env_nested_delimiter="__",
         case_sensitive=False,
         extra="ignore"  # Ignore unknown environment variables for now
     )
@@ -188,7 +167,7 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False)
     log_level: str = Field(default="INFO")
     
-    # Subsections - will auto-load from environment variables
+    # Subsections - populated from SECTION__FIELD environment variables
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     api_keys: APIKeySettings = Field(default_factory=APIKeySettings)
     external_apis: ExternalAPISettings = Field(default_factory=ExternalAPISettings)
@@ -199,6 +178,10 @@ class Settings(BaseSettings):
     features: FeatureFlags = Field(default_factory=FeatureFlags)
     batch: BatchProcessingSettings = Field(default_factory=BatchProcessingSettings)
     
+    # Each data/cache directory is created once per process, not on every
+    # Settings() construction (override_settings in tests builds many)
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+    
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
@@ -211,6 +194,11 @@ class Settings(BaseSettings):
     
     def model_post_init(self, __context) -> None:
         """Post-initialization validation and setup."""
+        for directory in (Path(self.database.path).parent, Path(self.cache.dir)):
+            if directory not in Settings._ensured_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                Settings._ensured_dirs.add(directory)
+        
         # In production, ensure critical settings are configured
         if self.is_production:
             if self.security.secret_key == "dev-secret-key-change-in-production":
@@ -220,13 +208,22 @@ class Settings(BaseSettings):
                 raise ValueError("DEBUG must be False in production")
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the global settings instance.
+    
+    Built on first call and cached: constructing Settings reads .env and
+    the environment, so it should happen once per process.
+    """
+    return Settings()
 
 
-def get_settings() -> Settings:
-    """Get the global settings instance."""
-    return settings
+def __getattr__(name: str):
+    """Resolve the module-level `settings` lazily (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # For testing, we can override settings
@@ -0,0 +1,7 @@
+"""Shared test setup: make the database/ modules importable as in the scripts."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "database"), str(ROOT)]
@@ -0,0 +1,13 @@
+"""Settings construction."""
+
+from src.config import override_settings
+
+
+def test_override_settings_creates_each_directory(tmp_path):
+    override_settings(cache={'dir': str(tmp_path / "cache_a")})
+    override_settings(cache={'dir': str(tmp_path / "cache_b")},
+                      database={'path': str(tmp_path / "db" / "test.db")})
+    
+    assert (tmp_path / "cache_a").is_dir()
+    assert (tmp_path / "cache_b").is_dir()
+    assert (tmp_path / "db").is_dir()
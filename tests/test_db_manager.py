@@ -0,0 +1,139 @@
+"""DatabaseManager behaviour on a fresh database."""
+
+import shutil
+import threading
+
+import pytest
+
+# The sqlite3 module db_manager actually uses (pysqlite3 when installed):
+# its exception classes are distinct from the stdlib ones
+from db_manager import ConnectionPool, DatabaseManager, QueryPerformanceMonitor, sqlite3
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "test.db"))
+    yield manager
+    manager.close()
+
+
+def test_dates_returned_as_stored_text(db):
+    with db.get_transaction() as conn:
+        conn.execute(
+            "INSERT INTO papers (id, title, doi, publication_date, created_at, secondary_domains) "
+            "VALUES (1, 'A', '10.1/a', '2024-03-01', '2024-03-01T10:00:00Z', ?)",
+            (["nlp", "ml"],)
+        )
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT publication_date, created_at, secondary_domains FROM papers"
+        ).fetchone()
+    assert tuple(row) == ("2024-03-01", "2024-03-01T10:00:00Z", ["nlp", "ml"])
+
+
+def test_nested_transaction_error_rolls_back_once(db, caplog):
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.get_transaction():
+            db.bulk_insert('journals', [(1, 'x'), (2, 'x')])
+    
+    with db.get_connection() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM journals").fetchone()[0] == 0
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 1
+
+
+def test_error_caught_inside_transaction_keeps_outer_work(db):
+    with db.get_transaction() as conn:
+        conn.execute("INSERT INTO journals (id, name) VALUES (1, 'a')")
+        with pytest.raises(sqlite3.IntegrityError):
+            # The failing batch's earlier rows must not commit either
+            db.bulk_insert('journals', [(2, 'b'), (3, 'c'), (4, 'a')])
+    
+    with db.get_connection() as conn:
+        assert [tuple(r) for r in conn.execute("SELECT id, name FROM journals")] == [(1, 'a')]
+
+
+def test_monitor_samples_bounded_per_query(db):
+    monitor = QueryPerformanceMonitor(db, max_samples=8)
+    for _ in range(50):
+        monitor.execute_with_monitoring("SELECT COUNT(*) FROM papers")
+    
+    assert monitor._stats_db.execute("SELECT COUNT(*) FROM samples").fetchone()[0] == 8
+    report = monitor.get_performance_report()
+    assert report['unique_queries'] == 1
+    assert report['total_calls'] == 50
+    [stats] = report['slowest_queries']
+    assert stats['count'] == 50
+    assert 0 < stats['p95_ms'] <= stats['max_ms']
+
+
+@pytest.mark.skipif(shutil.which("sqlite3") is None, reason="needs the sqlite3 shell")
+def test_bulk_import_csv_loads_none_as_null(db):
+    db.bulk_import_csv('authors', ('id', 'name', 'affiliation', 'h_index'),
+                       [(1, 'Ada', None, 3), (2, 'Grace', 'Navy', None)])
+    
+    with db.get_connection() as conn:
+        rows = conn.execute("SELECT id, name, affiliation, h_index FROM authors ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [(1, 'Ada', None, 3), (2, 'Grace', 'Navy', None)]
+
+
+def test_vacuum_step_refuses_open_transaction(db):
+    with pytest.raises(RuntimeError):
+        with db.get_transaction() as conn:
+            conn.execute("INSERT INTO journals (id, name) VALUES (1, 'a')")
+            db.vacuum_step()
+    
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM journals").fetchone()[0] == 0
+
+
+def test_monitor_routes_reads_to_reader_pool(db):
+    monitor = QueryPerformanceMonitor(db)
+    with db.get_transaction() as conn:
+        conn.execute("INSERT INTO journals (id, name) VALUES (1, 'a')")
+        # A reader does not see the writer's uncommitted row
+        assert monitor.execute_with_monitoring("SELECT COUNT(*) FROM journals")[0][0] == 0
+        assert monitor.execute_with_monitoring(
+            "SELECT COUNT(*) FROM journals", readonly=False)[0][0] == 1
+    
+    monitor.execute_with_monitoring("INSERT INTO journals (id, name) VALUES (2, 'b')")
+    with pytest.raises(sqlite3.OperationalError):
+        monitor.execute_with_monitoring("DELETE FROM journals", readonly=True)
+
+
+def test_connection_pool(db):
+    pool = ConnectionPool(str(db.db_path), pool_size=2, timeout=0.1)
+    try:
+        writer = pool.get_connection()
+        readers = [pool.get_connection(readonly=True) for _ in range(2)]
+        assert writer not in readers
+        with pytest.raises(sqlite3.OperationalError):
+            readers[0].execute("INSERT INTO journals (id, name) VALUES (1, 'a')")
+        
+        # Exhausted: no third reader, and the writer is held by this thread
+        # but not by another one
+        with pytest.raises(TimeoutError):
+            pool.get_connection(readonly=True)
+        timed_out = []
+        
+        def borrow_writer():
+            try:
+                pool.get_connection()
+            except TimeoutError:
+                timed_out.append(True)
+        
+        thread = threading.Thread(target=borrow_writer)
+        thread.start()
+        thread.join()
+        assert timed_out
+        
+        # A reader returned mid-transaction is rolled back
+        readers[0].execute("BEGIN")
+        readers[0].execute("SELECT 1 FROM journals").fetchall()
+        pool.return_connection(readers[0])
+        assert not readers[0].in_transaction
+        
+        pool.return_connection(readers[1])
+        pool.return_connection(writer)
+    finally:
+        pool.close()
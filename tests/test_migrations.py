@@ -0,0 +1,89 @@
+"""
+Upgrading databases created from the baseline schema.
+
+tests/fixtures/baseline_schema.sql is the original database/schema.sql;
+DatabaseManager must bring a database built from it up to the current
+schema without losing rows.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from db_manager import DatabaseManager
+
+BASELINE_SCHEMA = Path(__file__).parent / "fixtures" / "baseline_schema.sql"
+
+
+def build_baseline_db(path: Path, with_rows: bool) -> Path:
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA.read_text())
+    if with_rows:
+        conn.executemany(
+            "INSERT INTO papers (id, title, doi, journal, publication_date) VALUES (?, ?, ?, ?, ?)",
+            [(1, "A", "10.1/a", "Nature", "2020-01-01"),
+             (2, "B", "10.1/b", "Science", "2021-01-01"),
+             (3, "C", "10.1/c", None, "2022-01-01")],
+        )
+        conn.executemany(
+            "INSERT INTO citations (citing_paper_id, cited_paper_id, citation_type) VALUES (?, ?, ?)",
+            [(2, 1, "comparative"), (3, 1, None), (3, 2, "methodological")],
+        )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def index_sql(db: DatabaseManager, name: str) -> str:
+    with db.get_connection() as conn:
+        return conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='index' AND name=?", (name,)
+        ).fetchone()[0]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("with_rows", [True, False])
+def test_baseline_database_opens(tmp_path, with_rows):
+    db = DatabaseManager(str(build_baseline_db(tmp_path / "old.db", with_rows)))
+    
+    assert index_sql(db, "idx_citations_type_date") == \
+        "CREATE INDEX idx_citations_type_date ON citations(citation_type_id, created_at)"
+    with db.get_connection() as conn:
+        conn.execute("SELECT * FROM citation_network").fetchall()
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name='citations'"
+        ).fetchone()[0]
+    assert "WITHOUT ROWID" in table_sql
+    db.close()
+
+
+@pytest.mark.integration
+def test_citation_types_backfilled(tmp_path):
+    db = DatabaseManager(str(build_baseline_db(tmp_path / "old.db", with_rows=True)))
+    
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT citing_paper_id, cited_paper_id, citation_type "
+            "FROM citation_network ORDER BY 1, 2"
+        ).fetchall()
+    # NULL legacy types match no name and fall back to 'background'
+    assert [tuple(r) for r in rows] == [
+        (2, 1, "comparative"), (3, 1, "background"), (3, 2, "methodological")
+    ]
+    db.close()
+
+
+@pytest.mark.integration
+def test_journals_backfilled(tmp_path):
+    db = DatabaseManager(str(build_baseline_db(tmp_path / "old.db", with_rows=True)))
+    
+    assert index_sql(db, "idx_papers_journal") == \
+        "CREATE INDEX idx_papers_journal ON papers(journal_id)"
+    with db.get_connection() as conn:
+        rows = conn.execute(
+            "SELECT p.id, j.name FROM papers p "
+            "LEFT JOIN journals j ON j.id = p.journal_id ORDER BY p.id"
+        ).fetchall()
+    assert [tuple(r) for r in rows] == [(1, "Nature"), (2, "Science"), (3, None)]
+    db.close()